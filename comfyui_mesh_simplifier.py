@@ -31,8 +31,12 @@ PyMeshLab Copyright:
 
 import os
 import sys
-import tempfile
+import threading
+import logging
+import multiprocessing
 import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import trimesh
 import pymeshlab
@@ -47,6 +51,26 @@ MANIFEST = {
     "description": "A node for ComfyUI that simplifies 3D meshes with texture preservation using PyMeshLab",
 }
 
+logger = logging.getLogger("mesh_simplifier")
+
+# Optional mesh attributes, probed once per mesh
+MeshCaps = namedtuple('MeshCaps', ['tex', 'albedo', 'mr', 'device'])
+
+def _mesh_caps(mesh):
+    """Look up which optional attributes a mesh provides"""
+    return MeshCaps(
+        tex=getattr(mesh, 'vt', None) is not None and getattr(mesh, 'ft', None) is not None,
+        albedo=getattr(mesh, 'albedo', None) is not None,
+        mr=getattr(mesh, 'metallicRoughness', None) is not None,
+        device=getattr(mesh, 'device', None),
+    )
+
+def _to_np(tensor):
+    """Convert a tensor to numpy, avoiding a copy when it is already on the CPU"""
+    if tensor.device.type == 'cpu':
+        return tensor.detach().numpy()
+    return tensor.detach().cpu().numpy()
+
 class MeshSimplifierNode:
     """
     ComfyUI node that simplifies 3D meshes using PyMeshLab's Quadric Edge Collapse Decimation algorithm.
@@ -69,6 +93,8 @@ class MeshSimplifierNode:
                 "preserve_normal": (["True", "False"], {"default": "True"}),
                 "planar_simplification": (["True", "False"], {"default": "True"}),
                 "pre_clean": (["True", "False"], {"default": "True"}),
+                "edge_flip_postprocess": (["True", "False"], {"default": "True"}),
+                "backend": (["pymeshlab", "meshoptimizer"], {"default": "pymeshlab"}),
             }
         }
 
@@ -92,15 +118,100 @@ When using this tool in academic projects, please cite PyMeshLab:
 month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
 """
 
+    def __init__(self):
+        # The MeshSet is created on first use and reused across invocations.
+        # PyMeshLab's MeshSet is not reentrant, so access is serialized.
+        self._ms = None
+        self._ms_lock = threading.Lock()
+
+    def _get_meshset(self):
+        """Return the cached MeshSet, creating it on first use"""
+        if self._ms is None:
+            self._ms = pymeshlab.MeshSet()
+        return self._ms
+
+    @classmethod
+    def simplify_batch(cls, meshes, simplify_method, target_faces, percentage_reduction,
+                       quality_threshold, texture_weight, preserve_boundary, boundary_weight,
+                       optimal_position, preserve_normal, planar_simplification, pre_clean,
+                       edge_flip_postprocess="True"):
+        """
+        Simplify several meshes in parallel with PyMeshLab.
+        
+        A MeshSet is not reentrant and the decimation holds the GIL, so each
+        mesh is simplified in a worker process with its own MeshSet. Only the
+        numpy arrays of each mesh are sent to and from the workers.
+        
+        The workers are forked, since ComfyUI loads this module under a name
+        that spawned processes cannot import. Where fork is not available
+        (Windows), the meshes are simplified one after another in-process.
+        
+        Args:
+            meshes: List of ComfyUI/Comfy3D mesh objects
+            Other parameters: Same as simplify_mesh
+            
+        Returns:
+            List of simplified meshes, in the same order as the input
+        """
+        if not meshes:
+            return []
+        
+        node = cls()
+        percentage = simplify_method != "target_faces"
+        params = dict(
+            target_faces=None if percentage else int(target_faces),
+            percentage_reduction=float(percentage_reduction) if percentage else None,
+            quality_threshold=quality_threshold,
+            texture_weight=texture_weight,
+            preserve_boundary=node._bool_str_to_bool(preserve_boundary),
+            boundary_weight=boundary_weight,
+            optimal_position=node._bool_str_to_bool(optimal_position),
+            preserve_normal=node._bool_str_to_bool(preserve_normal),
+            planar_simplification=node._bool_str_to_bool(planar_simplification),
+            pre_clean=node._bool_str_to_bool(pre_clean),
+            edge_flip_postprocess=node._bool_str_to_bool(edge_flip_postprocess),
+        )
+        
+        # Meshes that would keep every face are returned untouched
+        simplified_meshes = list(meshes)
+        pending = [i for i, mesh in enumerate(meshes)
+                   if node._needs_reduction(len(mesh.f), params['target_faces'], params['percentage_reduction'])]
+        if not pending:
+            return simplified_meshes
+        
+        bundles = []
+        caps = [_mesh_caps(mesh) for mesh in meshes]
+        for i in pending:
+            bundles.append(node._mesh_to_arrays(meshes[i], caps[i].tex))
+        
+        if "fork" in multiprocessing.get_all_start_methods():
+            max_workers = max(1, min(len(pending), (os.cpu_count() or 2) // 2))
+            logger.info("Simplifying %d meshes with %d worker processes...", len(pending), max_workers)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("fork")) as executor:
+                futures = [executor.submit(_simplify_batch_worker, bundle, params) for bundle in bundles]
+                results = [future.result() for future in futures]
+        else:
+            logger.info("Simplifying %d meshes sequentially...", len(pending))
+            results = [node._simplify_arrays(*bundle, **params) for bundle in bundles]
+        
+        for i, (out_v, out_f, out_vt, out_ft, out_vn) in zip(pending, results):
+            mesh = meshes[i]
+            simplified_mesh = node._build_mesh(mesh, out_v, out_f, out_vt, out_ft, out_vn)
+            simplified_meshes[i] = node._finalize_mesh(mesh, simplified_mesh, caps[i])
+        return simplified_meshes
+
     def _bool_str_to_bool(self, bool_str):
         """Convert string bool representation to actual boolean"""
         return bool_str == "True"
 
     def simplify_mesh(self, mesh, simplify_method, target_faces, percentage_reduction, 
                     quality_threshold, texture_weight, preserve_boundary, boundary_weight,
-                    optimal_position, preserve_normal, planar_simplification, pre_clean):
+                    optimal_position, preserve_normal, planar_simplification, pre_clean,
+                    edge_flip_postprocess="True", backend="pymeshlab"):
         """
-        Simplify the input mesh using PyMeshLab through temporary OBJ files.
+        Simplify the input mesh using PyMeshLab or, for meshes without textures,
+        optionally meshoptimizer. The geometry is passed in memory.
         
         Args:
             mesh: ComfyUI/Comfy3D mesh object
@@ -115,6 +226,7 @@ month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
         preserve_normal = self._bool_str_to_bool(preserve_normal)
         planar_simplification = self._bool_str_to_bool(planar_simplification)
         pre_clean = self._bool_str_to_bool(pre_clean)
+        edge_flip_postprocess = self._bool_str_to_bool(edge_flip_postprocess)
         
         # Set target faces or percentage reduction based on simplify_method
         if simplify_method == "target_faces":
@@ -124,119 +236,405 @@ month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
             target_faces_val = None
             percentage_reduction_val = float(percentage_reduction)
         
-        # Create temporary OBJ files
-        with tempfile.NamedTemporaryFile(suffix='.obj', delete=False) as tmp:
-            input_obj = tmp.name
-        with tempfile.NamedTemporaryFile(suffix='.obj', delete=False) as tmp:
-            output_obj = tmp.name
+        # Print mesh stats before simplification
+        logger.info("Original mesh: %d vertices, %d faces", len(mesh.v), len(mesh.f))
+        caps = _mesh_caps(mesh)
+        has_texture = caps.tex
+        if has_texture:
+            logger.info("Mesh has texture coordinates: %d texture vertices", len(mesh.vt))
+        else:
+            logger.info("Mesh does not have texture coordinates")
         
-        try:
-            # Print mesh stats before simplification
-            print(f"Original mesh: {len(mesh.v):,} vertices, {len(mesh.f):,} faces")
-            has_texture = hasattr(mesh, 'vt') and mesh.vt is not None and mesh.ft is not None
-            if has_texture:
-                print(f"Mesh has texture coordinates: {len(mesh.vt):,} texture vertices")
-            else:
-                print("Mesh does not have texture coordinates")
-            
-            # Save the mesh to OBJ format
-            print(f"Saving mesh to temporary OBJ file: {input_obj}")
-            mesh.write_obj(input_obj)
-            
-            # Simplify the mesh
-            print(f"Simplifying mesh...")
-            
-            if has_texture:
-                # Use texture-preserving simplification for meshes with textures
-                print("Using texture-preserving simplification")
-                self._simplify_with_texture(
-                    input_obj, 
-                    output_obj, 
-                    target_faces_val, 
-                    percentage_reduction_val,
-                    quality_threshold,
-                    texture_weight,
-                    preserve_boundary,
-                    boundary_weight,
-                    optimal_position,
-                    preserve_normal,
-                    planar_simplification,
-                    pre_clean
-                )
-            else:
-                # Use standard simplification for meshes without textures
-                print("Using standard simplification without texture preservation")
-                self._simplify_without_texture(
-                    input_obj, 
-                    output_obj, 
-                    target_faces_val, 
-                    percentage_reduction_val,
-                    quality_threshold,
-                    preserve_boundary,
-                    boundary_weight,
-                    optimal_position,
-                    preserve_normal,
-                    planar_simplification,
-                    pre_clean
-                )
-            
-            # Load the simplified mesh back into ComfyUI-3D-Pack format
-            print(f"Loading simplified mesh from temporary OBJ file: {output_obj}")
-            simplified_mesh = type(mesh).load(output_obj, resize=False, renormal=True, retex=False)
-            
-            # Copy any attributes from the original mesh that might not have been saved to OBJ
-            for attr in ['device', 'ori_center', 'ori_scale']:
-                if hasattr(mesh, attr):
-                    setattr(simplified_mesh, attr, getattr(mesh, attr))
+        # Skip all conversion and filter setup when no faces would be removed
+        if not self._needs_reduction(len(mesh.f), target_faces_val, percentage_reduction_val):
+            logger.info("No reduction requested, returning original mesh")
+            return (mesh,)
+        
+        simplified_mesh = None
+        if backend != "pymeshlab" and has_texture:
+            logger.info("%s backend does not preserve textures, using PyMeshLab instead", backend)
+        elif backend == "meshoptimizer":
+            simplified_mesh = self._simplify_with_meshoptimizer(
+                mesh,
+                target_faces_val,
+                percentage_reduction_val,
+                quality_threshold,
+                preserve_boundary,
+                pre_clean
+            )
+        
+        if simplified_mesh is None:
+            simplified_mesh = self._simplify_with_pymeshlab(
+                mesh,
+                has_texture,
+                target_faces_val,
+                percentage_reduction_val,
+                quality_threshold,
+                texture_weight,
+                preserve_boundary,
+                boundary_weight,
+                optimal_position,
+                preserve_normal,
+                planar_simplification,
+                pre_clean,
+                edge_flip_postprocess
+            )
+        
+        simplified_mesh = self._finalize_mesh(mesh, simplified_mesh, caps)
+        if has_texture and getattr(simplified_mesh, 'vt', None) is None:
+            logger.warning("Texture coordinates were lost during simplification")
+        
+        return (simplified_mesh,)
+    
+    def _finalize_mesh(self, mesh, simplified_mesh, caps):
+        """
+        Carry over textures and non-geometry attributes from the original mesh.
+        """
+        # Copy any attributes from the original mesh that are not part of the geometry
+        for attr in ['device', 'ori_center', 'ori_scale']:
+            if hasattr(mesh, attr):
+                setattr(simplified_mesh, attr, getattr(mesh, attr))
+        
+        # Transfer texture from original mesh if available
+        if caps.albedo:
+            simplified_mesh.albedo = mesh.albedo
+            logger.info("Transferred texture from original mesh")
+        
+        # Transfer metallic-roughness map if available
+        if caps.mr:
+            simplified_mesh.metallicRoughness = mesh.metallicRoughness
+            logger.info("Transferred metallic-roughness map from original mesh")
+        
+        # Make sure we're using the same device as the original mesh. The
+        # geometry is normally built there already, so check where it actually
+        # lives instead of the device attribute copied above.
+        if caps.device is not None:
+            target = torch.device(caps.device)
+            current = simplified_mesh.v.device
+            if current.type != target.type or (target.index is not None and current.index != target.index):
+                simplified_mesh = simplified_mesh.to(caps.device)
+        
+        # Print mesh stats after simplification
+        logger.info("Simplified mesh: %d vertices, %d faces", len(simplified_mesh.v), len(simplified_mesh.f))
+        if getattr(simplified_mesh, 'vt', None) is not None:
+            logger.info("Simplified mesh has texture coordinates: %d texture vertices", len(simplified_mesh.vt))
+        
+        return simplified_mesh
+    
+    def _simplify_with_pymeshlab(self, mesh, has_texture, target_faces, percentage_reduction,
+                               quality_threshold, texture_weight, preserve_boundary, boundary_weight,
+                               optimal_position, preserve_normal, planar_simplification, pre_clean,
+                               edge_flip_postprocess):
+        """
+        Simplify a mesh with PyMeshLab, handing the geometry over in memory.
+        """
+        v, f, vt, ft = self._mesh_to_arrays(mesh, has_texture)
+        out_v, out_f, out_vt, out_ft, out_vn = self._simplify_arrays(
+            v, f, vt, ft,
+            target_faces,
+            percentage_reduction,
+            quality_threshold,
+            texture_weight,
+            preserve_boundary,
+            boundary_weight,
+            optimal_position,
+            preserve_normal,
+            planar_simplification,
+            pre_clean,
+            edge_flip_postprocess
+        )
+        
+        # Build the simplified mesh in ComfyUI-3D-Pack format
+        return self._build_mesh(mesh, out_v, out_f, out_vt, out_ft, out_vn)
+    
+    def _mesh_to_arrays(self, mesh, has_texture):
+        """
+        Extract vertices, faces and texture coordinates of a mesh as numpy arrays.
+        
+        Returns:
+            (v, f, vt, ft) where vt and ft are None for meshes without textures
+        """
+        # Keep the mesh's own single precision. pymeshlab.Mesh still converts
+        # to float64 internally, but float32 avoids a widening copy here and
+        # halves what simplify_batch pickles to its workers.
+        v = _to_np(mesh.v).astype(np.float32, copy=False)
+        f = _to_np(mesh.f).astype(np.int32, copy=False)
+        if not has_texture:
+            return v, f, None, None
+        vt = _to_np(mesh.vt).astype(np.float32, copy=False)
+        ft = _to_np(mesh.ft)
+        return v, f, vt, ft
+    
+    def _simplify_arrays(self, v, f, vt, ft, target_faces, percentage_reduction,
+                         quality_threshold, texture_weight, preserve_boundary, boundary_weight,
+                         optimal_position, preserve_normal, planar_simplification, pre_clean,
+                         edge_flip_postprocess):
+        """
+        Run the PyMeshLab simplification on numpy arrays.
+        
+        Texture-preserving simplification is used when vt and ft are given.
+        
+        Returns:
+            (v, f, vt, ft, vn) of the simplified mesh, with vt and ft set to None
+            when texture coordinates were not preserved
+        """
+        has_texture = vt is not None and ft is not None
+        
+        # Hand the mesh to PyMeshLab in memory instead of through an OBJ file
+        if has_texture:
+            # PyMeshLab stores texture coordinates per wedge (face corner), so
+            # gather them into one contiguous buffer with a single pass over ft.
+            # Passing them as w_tex_coords_matrix leaves the wedge texture index
+            # unset, which the texture-preserving decimation rejects. Instead,
+            # give every face corner its own vertex carrying its UV; the transfer
+            # to wedges below sets the index and the corners are welded back.
+            wedge_uvs = np.ascontiguousarray(vt[ft].reshape(-1, 2), dtype=np.float32)
+            corner_v = v[f].reshape(-1, 3)
+            corner_f = np.arange(len(corner_v), dtype=np.int32).reshape(-1, 3)
+            pml_mesh = pymeshlab.Mesh(vertex_matrix=corner_v, face_matrix=corner_f,
+                                      v_tex_coords_matrix=wedge_uvs)
+        else:
+            pml_mesh = pymeshlab.Mesh(vertex_matrix=v, face_matrix=f)
+        
+        with self._ms_lock:
+            ms = self._get_meshset()
+            try:
+                ms.clear()
+                ms.add_mesh(pml_mesh)
+                if has_texture:
+                    # Welding merges all coincident vertices, including ones that
+                    # were already split in the input mesh
+                    ms.apply_filter('compute_texcoord_transfer_vertex_to_wedge')
+                    ms.apply_filter('meshing_remove_duplicate_vertices')
             
-            # Transfer texture from original mesh if available
-            if hasattr(mesh, 'albedo') and mesh.albedo is not None:
-                simplified_mesh.albedo = mesh.albedo
-                print("Transferred texture from original mesh")
+                # Simplify the mesh
+                logger.info("Simplifying mesh...")
             
-            # Transfer metallic-roughness map if available
-            if hasattr(mesh, 'metallicRoughness') and mesh.metallicRoughness is not None:
-                simplified_mesh.metallicRoughness = mesh.metallicRoughness
-                print("Transferred metallic-roughness map from original mesh")
+                if has_texture:
+                    # Use texture-preserving simplification for meshes with textures
+                    logger.info("Using texture-preserving simplification")
+                    texture_preserved = self._simplify_with_texture(
+                        ms, 
+                        target_faces, 
+                        percentage_reduction,
+                        quality_threshold,
+                        texture_weight,
+                        preserve_boundary,
+                        boundary_weight,
+                        optimal_position,
+                        preserve_normal,
+                        planar_simplification,
+                        pre_clean,
+                        edge_flip_postprocess
+                    )
+                else:
+                    # Use standard simplification for meshes without textures
+                    logger.info("Using standard simplification without texture preservation")
+                    self._simplify_without_texture(
+                        ms, 
+                        target_faces, 
+                        percentage_reduction,
+                        quality_threshold,
+                        preserve_boundary,
+                        boundary_weight,
+                        optimal_position,
+                        preserve_normal,
+                        planar_simplification,
+                        pre_clean,
+                        edge_flip_postprocess
+                    )
+                    texture_preserved = False
             
-            # Make sure we're using the same device as the original mesh
-            if hasattr(mesh, 'device'):
-                simplified_mesh = simplified_mesh.to(mesh.device)
+                # Read the simplified mesh back from PyMeshLab
+                out_mesh = ms.current_mesh()
+                out_v = out_mesh.vertex_matrix()
+                out_f = out_mesh.face_matrix()
+                # The decimation filters leave per-vertex normals up to date
+                out_vn = out_mesh.vertex_normal_matrix()
+                out_vt = out_ft = None
+                if texture_preserved:
+                    # Collapse per-wedge coordinates back into shared texture vertices
+                    out_vt, out_ft = np.unique(out_mesh.wedge_tex_coord_matrix(), axis=0, return_inverse=True)
+                    out_ft = out_ft.reshape(-1, 3)
             
-            # Print mesh stats after simplification
-            print(f"Simplified mesh: {len(simplified_mesh.v):,} vertices, {len(simplified_mesh.f):,} faces")
-            if hasattr(simplified_mesh, 'vt') and simplified_mesh.vt is not None:
-                print(f"Simplified mesh has texture coordinates: {len(simplified_mesh.vt):,} texture vertices")
+                return out_v, out_f, out_vt, out_ft, out_vn
+            finally:
+                # Release the PyMeshLab meshes but keep the MeshSet for the next run
+                ms.clear()
+    
+    def _simplify_with_meshoptimizer(self, mesh, target_faces, percentage_reduction, quality_threshold,
+                                     preserve_boundary, pre_clean):
+        """
+        Simplify a mesh without textures using meshoptimizer.
+        
+        meshoptimizer only tracks position quadrics, which is all the
+        no-texture case needs, and avoids MeshLab's attribute bookkeeping.
+        
+        The allowed error is 1 - quality_threshold, relative to the mesh
+        extents. It is clamped to at least 0.01 (meshoptimizer's default), since
+        a zero error bound would stop the simplification immediately.
+        
+        preserve_boundary locks the border vertices. pre_clean welds vertices
+        with exactly the same position, since meshoptimizer cannot collapse
+        across seams in an unwelded mesh. The other PyMeshLab options have
+        no meshoptimizer equivalent and are ignored.
+        
+        Returns:
+            The simplified mesh, or None if meshoptimizer is not installed,
+            fails or removes no faces.
+        """
+        try:
+            import meshoptimizer
+        except ImportError:
+            logger.warning("meshoptimizer is not installed, falling back to PyMeshLab")
+            return None
+        
+        v = np.ascontiguousarray(_to_np(mesh.v), dtype=np.float32)
+        indices = np.ascontiguousarray(_to_np(mesh.f), dtype=np.uint32).ravel()
+        
+        if pre_clean:
+            # Merge duplicate vertices so the collapses can cross split edges
+            v, remap = np.unique(v, axis=0, return_inverse=True)
+            indices = np.ascontiguousarray(remap.reshape(-1)[indices], dtype=np.uint32)
+        
+        current_faces = len(indices) // 3
+        targetfacenum = self._target_face_count(current_faces, target_faces, percentage_reduction)
+        
+        logger.info("Starting meshoptimizer simplification (current: %d faces, target: %d faces)...", current_faces, targetfacenum)
+        start_time = time.time()
+        
+        target_error = max(1.0 - float(quality_threshold), 0.01)
+        options = meshoptimizer.SIMPLIFY_LOCK_BORDER if preserve_boundary else 0
+        destination = np.empty_like(indices)
+        try:
+            index_count = meshoptimizer.simplify(destination, indices, v,
+                                                 target_index_count=3 * targetfacenum,
+                                                 target_error=target_error,
+                                                 options=options)
+        except Exception as e:
+            logger.warning("meshoptimizer simplification failed with error: %s", e)
+            logger.info("Falling back to PyMeshLab...")
+            return None
+        if index_count >= len(indices):
+            logger.warning("meshoptimizer removed no faces, falling back to PyMeshLab")
+            return None
+        new_indices = destination[:index_count]
+        
+        # Drop the vertices that are no longer referenced by the simplified faces
+        used_vertices, remapped = np.unique(new_indices, return_inverse=True)
+        out_v = v[used_vertices]
+        out_f = remapped.reshape(-1, 3)
+        
+        elapsed = time.time() - start_time
+        new_faces = len(out_f)
+        reduction_percent = ((current_faces - new_faces) / current_faces) * 100
+        
+        logger.info("Mesh simplification completed in %.2f seconds.", elapsed)
+        logger.info("Reduced from %d to %d faces (%.1f%% reduction)", current_faces, new_faces, reduction_percent)
+        
+        return self._build_mesh(mesh, out_v, out_f)
+    
+    def _needs_reduction(self, current_faces, target_faces, percentage_reduction):
+        """Check whether the simplification settings would remove any faces"""
+        if percentage_reduction is not None and percentage_reduction < 0.001:
+            return False
+        return self._target_face_count(current_faces, target_faces, percentage_reduction) < current_faces
+    
+    def _target_face_count(self, current_faces, target_faces, percentage_reduction):
+        """Calculate the target face count from the simplification settings"""
+        if target_faces is not None and target_faces > 0:
+            targetfacenum = int(target_faces)
+        elif percentage_reduction is not None and 0.0 <= percentage_reduction <= 1.0:
+            targetfacenum = int(current_faces * (1.0 - percentage_reduction))
+        else:
+            # Default case
+            targetfacenum = int(target_faces) if target_faces is not None else 1000
             
-            return (simplified_mesh,)
-        finally:
-            # Clean up the temporary files
-            if os.path.exists(input_obj):
-                os.remove(input_obj)
-            if os.path.exists(output_obj):
-                os.remove(output_obj)
+        # Ensure we don't go below a minimum number of faces
+        return max(4, targetfacenum)
     
-    def _simplify_with_texture(self, input_path, output_path, target_faces, percentage_reduction,
-                             quality_threshold, texture_weight, preserve_boundary, boundary_weight,
-                             optimal_position, preserve_normal, planar_simplification, pre_clean):
+    def _build_mesh(self, mesh, v, f, vt=None, ft=None, vn=None):
+        """
+        Create a mesh of the same type as the input from simplified numpy arrays.
+        
+        When vertex normals are given they are used as-is (indexed like the
+        faces), otherwise they are recomputed for the new topology.
+        """
+        device = getattr(mesh, 'device', None)
+        target = torch.device(device) if device is not None else None
+        
+        def to_tensor(arr, dtype):
+            # from_numpy shares the array's memory, so only a device change copies
+            tensor = torch.from_numpy(np.ascontiguousarray(arr, dtype=dtype))
+            if target is not None and tensor.device != target:
+                tensor = tensor.to(target)
+            return tensor
+        
+        attrs = dict(
+            v=to_tensor(v, np.float32),
+            f=to_tensor(f, np.int32),
+            vt=to_tensor(vt, np.float32) if vt is not None else None,
+            ft=to_tensor(ft, np.int32) if ft is not None else None,
+        )
+        if vn is not None:
+            attrs['vn'] = to_tensor(vn, np.float32)
+            attrs['fn'] = attrs['f']
+        
+        try:
+            simplified_mesh = type(mesh)(device=device, **attrs)
+        except TypeError:
+            # Mesh types whose constructor does not take the geometry
+            simplified_mesh = type(mesh).__new__(type(mesh))
+            for name, value in attrs.items():
+                setattr(simplified_mesh, name, value)
+            simplified_mesh.device = device
+        
+        # Recompute vertex normals for the new topology
+        if vn is None and hasattr(simplified_mesh, 'auto_normal'):
+            simplified_mesh.auto_normal()
+        
+        return simplified_mesh
+    
+    def _should_edge_flip(self, edge_flip_postprocess, current_faces, new_faces):
+        """
+        Decide whether to run the edge-flip post-process.
+        
+        For aggressive reductions (keeping 25% of the faces or fewer) the
+        two-iteration flip sweep costs about as much as the decimation itself
+        for little visible gain, so it is skipped.
         """
-        Simplify a mesh with texture preservation.
+        if not edge_flip_postprocess:
+            return False
+        if new_faces <= current_faces * 0.25:
+            logger.info("Skipping edge-flip post-processing for aggressive reduction")
+            return False
+        return True
+    
+    def _simplify_with_texture(self, ms, target_faces, percentage_reduction,
+                             quality_threshold, texture_weight, preserve_boundary, boundary_weight,
+                             optimal_position, preserve_normal, planar_simplification, pre_clean,
+                             edge_flip_postprocess):
         """
-        # Create a MeshSet
-        ms = pymeshlab.MeshSet()
+        Simplify the current mesh of the MeshSet with texture preservation.
         
-        # Load the mesh
-        ms.load_new_mesh(input_path)
+        The decimation is passed selected=False (PyMeshLab's default) so it
+        always simplifies the whole mesh rather than only the current
+        selection.
         
+        Returns:
+            True if texture coordinates were preserved, False if the fallback
+            to standard simplification was used.
+        """
         # Get current face count for calculation
-        current_faces = ms.current_mesh().face_number()
-        current_vertices = ms.current_mesh().vertex_number()
+        current = ms.current_mesh()
+        current_faces = current.face_number()
+        current_vertices = current.vertex_number()
         
-        print(f"Loaded mesh: {current_vertices:,} vertices, {current_faces:,} faces")
+        logger.info("Loaded mesh: %d vertices, %d faces", current_vertices, current_faces)
         
         # Pre-processing step to clean the mesh
         if pre_clean:
-            print(f"Performing pre-processing cleaning operations...")
+            logger.info("Performing pre-processing cleaning operations...")
             
             # Merge close vertices (helps with many common mesh issues)
             ms.apply_filter('meshing_merge_close_vertices')
@@ -248,35 +646,27 @@ month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
             ms.apply_filter('meshing_remove_duplicate_faces')
             
             # Update counts after pre-processing
-            cleaned_vertices = ms.current_mesh().vertex_number()
-            cleaned_faces = ms.current_mesh().face_number()
+            cleaned = ms.current_mesh()
+            cleaned_vertices = cleaned.vertex_number()
+            cleaned_faces = cleaned.face_number()
             
             # Report the effect of pre-processing
             vertices_removed = current_vertices - cleaned_vertices
             faces_removed = current_faces - cleaned_faces
             
             if vertices_removed > 0 or faces_removed > 0:
-                print(f"Pre-processing removed {vertices_removed:,} vertices and {faces_removed:,} faces")
-                print(f"Mesh after cleaning: {cleaned_vertices:,} vertices, {cleaned_faces:,} faces")
+                logger.info("Pre-processing removed %d vertices and %d faces", vertices_removed, faces_removed)
+                logger.info("Mesh after cleaning: %d vertices, %d faces", cleaned_vertices, cleaned_faces)
             else:
-                print("Pre-processing complete. No issues found in the mesh.")
+                logger.info("Pre-processing complete. No issues found in the mesh.")
             
             # Update current faces count for target calculation
             current_faces = cleaned_faces
         
         # Calculate target face count
-        if target_faces is not None and target_faces > 0:
-            targetfacenum = int(target_faces)
-        elif percentage_reduction is not None and 0.0 <= percentage_reduction <= 1.0:
-            targetfacenum = int(current_faces * (1.0 - percentage_reduction))
-        else:
-            # Default case
-            targetfacenum = int(target_faces) if target_faces is not None else 1000
-            
-        # Ensure we don't go below a minimum number of faces
-        targetfacenum = max(4, targetfacenum)
+        targetfacenum = self._target_face_count(current_faces, target_faces, percentage_reduction)
         
-        print(f"Starting mesh simplification (current: {current_faces:,} faces, target: {targetfacenum:,} faces)...")
+        logger.info("Starting mesh simplification (current: %d faces, target: %d faces)...", current_faces, targetfacenum)
         start_time = time.time()
         
         try:
@@ -289,21 +679,23 @@ month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
                         boundaryweight=float(boundary_weight),
                         optimalplacement=optimal_position,
                         preservenormal=preserve_normal,
-                        planarquadric=planar_simplification)
+                        planarquadric=planar_simplification,
+                        selected=False)
+            new_faces = ms.current_mesh().face_number()
             
             # Optional: Quality improvement as post-processing
-            ms.apply_filter('meshing_edge_flip_by_planar_optimization',
-                        planartype='area/max side',
-                        pthreshold=1.0,
-                        iterations=2)
+            if self._should_edge_flip(edge_flip_postprocess, current_faces, new_faces):
+                ms.apply_filter('meshing_edge_flip_by_planar_optimization',
+                            planartype='area/max side',
+                            pthreshold=1.0,
+                            iterations=2)
         except Exception as e:
-            print(f"Warning: Texture simplification failed with error: {e}")
-            print("Falling back to standard simplification...")
+            logger.warning("Texture simplification failed with error: %s", e)
+            logger.info("Falling back to standard simplification...")
             
             # Fall back to standard simplification if texture simplification fails
             self._simplify_without_texture(
-                input_path, 
-                output_path, 
+                ms, 
                 target_faces, 
                 percentage_reduction,
                 quality_threshold,
@@ -312,41 +704,42 @@ month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
                 optimal_position,
                 preserve_normal,
                 planar_simplification,
-                False  # Don't do pre-clean again
+                False,  # Don't do pre-clean again
+                edge_flip_postprocess
             )
-            return
+            return False
         
         elapsed = time.time() - start_time
-        new_faces = ms.current_mesh().face_number()
         reduction_percent = ((current_faces - new_faces) / current_faces) * 100
         
-        print(f"Mesh simplification completed in {elapsed:.2f} seconds.")
-        print(f"Reduced from {current_faces:,} to {new_faces:,} faces ({reduction_percent:.1f}% reduction)")
+        logger.info("Mesh simplification completed in %.2f seconds.", elapsed)
+        logger.info("Reduced from %d to %d faces (%.1f%% reduction)", current_faces, new_faces, reduction_percent)
         
-        # Save the mesh
-        ms.save_current_mesh(output_path)
+        return True
     
-    def _simplify_without_texture(self, input_path, output_path, target_faces, percentage_reduction,
+    def _simplify_without_texture(self, ms, target_faces, percentage_reduction,
                                 quality_threshold, preserve_boundary, boundary_weight,
-                                optimal_position, preserve_normal, planar_simplification, pre_clean):
+                                optimal_position, preserve_normal, planar_simplification, pre_clean,
+                                edge_flip_postprocess):
         """
-        Simplify a mesh without texture preservation.
-        """
-        # Create a MeshSet
-        ms = pymeshlab.MeshSet()
-        
-        # Load the mesh
-        ms.load_new_mesh(input_path)
+        Simplify the current mesh of the MeshSet without texture preservation.
         
+        selected=False and qualityweight=False are PyMeshLab's defaults and
+        are passed explicitly: the whole mesh is simplified, and per-vertex
+        quality does not weight the collapse costs. autoclean keeps its
+        default and removes the unreferenced vertices and degenerate faces
+        left by the collapses.
+        """
         # Get current face count for calculation
-        current_faces = ms.current_mesh().face_number()
-        current_vertices = ms.current_mesh().vertex_number()
+        current = ms.current_mesh()
+        current_faces = current.face_number()
+        current_vertices = current.vertex_number()
         
-        print(f"Loaded mesh: {current_vertices:,} vertices, {current_faces:,} faces")
+        logger.info("Loaded mesh: %d vertices, %d faces", current_vertices, current_faces)
         
         # Pre-processing step to clean the mesh
         if pre_clean:
-            print(f"Performing pre-processing cleaning operations...")
+            logger.info("Performing pre-processing cleaning operations...")
             
             # Merge close vertices (helps with many common mesh issues)
             ms.apply_filter('meshing_merge_close_vertices')
@@ -358,35 +751,27 @@ month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
             ms.apply_filter('meshing_remove_duplicate_faces')
             
             # Update counts after pre-processing
-            cleaned_vertices = ms.current_mesh().vertex_number()
-            cleaned_faces = ms.current_mesh().face_number()
+            cleaned = ms.current_mesh()
+            cleaned_vertices = cleaned.vertex_number()
+            cleaned_faces = cleaned.face_number()
             
             # Report the effect of pre-processing
             vertices_removed = current_vertices - cleaned_vertices
             faces_removed = current_faces - cleaned_faces
             
             if vertices_removed > 0 or faces_removed > 0:
-                print(f"Pre-processing removed {vertices_removed:,} vertices and {faces_removed:,} faces")
-                print(f"Mesh after cleaning: {cleaned_vertices:,} vertices, {cleaned_faces:,} faces")
+                logger.info("Pre-processing removed %d vertices and %d faces", vertices_removed, faces_removed)
+                logger.info("Mesh after cleaning: %d vertices, %d faces", cleaned_vertices, cleaned_faces)
             else:
-                print("Pre-processing complete. No issues found in the mesh.")
+                logger.info("Pre-processing complete. No issues found in the mesh.")
             
             # Update current faces count for target calculation
             current_faces = cleaned_faces
         
         # Calculate target face count
-        if target_faces is not None and target_faces > 0:
-            targetfacenum = int(target_faces)
-        elif percentage_reduction is not None and 0.0 <= percentage_reduction <= 1.0:
-            targetfacenum = int(current_faces * (1.0 - percentage_reduction))
-        else:
-            # Default case
-            targetfacenum = int(target_faces) if target_faces is not None else 1000
-            
-        # Ensure we don't go below a minimum number of faces
-        targetfacenum = max(4, targetfacenum)
+        targetfacenum = self._target_face_count(current_faces, target_faces, percentage_reduction)
         
-        print(f"Starting standard mesh simplification (current: {current_faces:,} faces, target: {targetfacenum:,} faces)...")
+        logger.info("Starting standard mesh simplification (current: %d faces, target: %d faces)...", current_faces, targetfacenum)
         start_time = time.time()
         
         # Use the standard quadric edge collapse filter
@@ -397,20 +782,26 @@ month=jan, year=2021, publisher={Zenodo}, doi={10.5281/zenodo.4438750}}
                     boundaryweight=float(boundary_weight),
                     optimalplacement=optimal_position,
                     preservenormal=preserve_normal,
-                    planarquadric=planar_simplification)
+                    planarquadric=planar_simplification,
+                    qualityweight=False,
+                    selected=False)
+        new_faces = ms.current_mesh().face_number()
         
         # Optional: Quality improvement as post-processing
-        ms.apply_filter('meshing_edge_flip_by_planar_optimization',
-                    planartype='area/max side',
-                    pthreshold=1.0,
-                    iterations=2)
+        if self._should_edge_flip(edge_flip_postprocess, current_faces, new_faces):
+            ms.apply_filter('meshing_edge_flip_by_planar_optimization',
+                        planartype='area/max side',
+                        pthreshold=1.0,
+                        iterations=2)
         
         elapsed = time.time() - start_time
-        new_faces = ms.current_mesh().face_number()
         reduction_percent = ((current_faces - new_faces) / current_faces) * 100
         
-        print(f"Mesh simplification completed in {elapsed:.2f} seconds.")
-        print(f"Reduced from {current_faces:,} to {new_faces:,} faces ({reduction_percent:.1f}% reduction)")
-        
-        # Save the mesh
-        ms.save_current_mesh(output_path)
+        logger.info("Mesh simplification completed in %.2f seconds.", elapsed)
+        logger.info("Reduced from %d to %d faces (%.1f%% reduction)", current_faces, new_faces, reduction_percent)
+
+
+def _simplify_batch_worker(bundle, params):
+    """Simplify one (v, f, vt, ft) bundle in a worker process with its own MeshSet"""
+    v, f, vt, ft = bundle
+    return MeshSimplifierNode()._simplify_arrays(v, f, vt, ft, **params)